@@ -22,6 +22,15 @@ class PostAdmin(admin.ModelAdmin):
                             применять в списке записей.
         list_display_links: tuple -- Устанавливает, какие поля являются
                     ссылками на детальное представление из списка записей.
+        list_select_related: tuple -- Связанные модели, которые загружаются
+                    одним запросом вместе со списком записей.
+        autocomplete_fields: tuple -- Связанные поля, значения которых
+                    подгружаются поиском по мере ввода, а не целиком.
+
+    Методы:
+        get_queryset -- Добавляет к записям количество лайков,
+                    подсчитанное подзапросом вместе со списком.
+        likes_count -- Возвращает количество лайков публикации.
     """
 
     list_display = (
@@ -32,6 +41,8 @@ class PostAdmin(admin.ModelAdmin):
         'author',
         'pub_date',
         'created_at',
+        'likes_count',
+        'comment_count',
     )
     list_editable = (
         'is_published',
@@ -39,20 +50,34 @@ class PostAdmin(admin.ModelAdmin):
         'category',
     )
     search_fields = (
-        '^title',
-        '^category__title',
-        '^location__name',
-        '^author__username',
+        'title',
+        'category__title',
+        'location__name',
+        'author__username',
     )
     list_filter = (
         'is_published',
+        ('pub_date', admin.DateFieldListFilter),
+        'created_at',
+    )
+    list_display_links = ('title',)
+    list_select_related = (
         'category',
         'location',
         'author',
-        'pub_date',
-        'created_at',
     )
-    list_display_links = ('title',)
+    autocomplete_fields = (
+        'author',
+        'category',
+        'location',
+    )
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_likes_count()
+
+    @admin.display(description='Лайки', ordering='likes_count')
+    def likes_count(self, obj):
+        return obj.likes_count
 
 
 @admin.register(Category)
@@ -83,7 +108,7 @@ class CategoryAdmin(admin.ModelAdmin):
         'is_published',
     )
     search_fields = (
-        '^title',
+        'title',
         '^slug',
     )
     list_filter = (
@@ -121,7 +146,7 @@ class LocationAdmin(admin.ModelAdmin):
         'is_published',
     )
     search_fields = (
-        '^name',
+        'name',
     )
     list_filter = (
         'name',
@@ -145,10 +170,16 @@ class CommentAdmin(admin.ModelAdmin):
                             применять в списке записей.
         list_display_links: tuple -- Устанавливает, какие поля являются
                     ссылками на детальное представление из списка записей.
+        list_select_related: tuple -- Связанные модели, которые загружаются
+                    одним запросом вместе со списком записей.
+
+    Методы:
+        post_title -- Возвращает заголовок поста, к которому относится
+                    комментарий.
     """
 
     list_display = (
-        'comment_post',
+        'post_title',
         'text',
         'author',
         'created_at',
@@ -161,3 +192,11 @@ class CommentAdmin(admin.ModelAdmin):
         'created_at',
     )
     list_display_links = ('text',)
+    list_select_related = (
+        'comment_post',
+        'author',
+    )
+
+    @admin.display(description='Пост', ordering='comment_post__title')
+    def post_title(self, obj):
+        return obj.comment_post.title
@@ -1,2 +1,51 @@
 POSTS_LIMIT = 10
 LIMIT_OF_SYMBOLS = 20
+POST_LIST_FIELDS = (
+    'title',
+    'text',
+    'image',
+    'image_width',
+    'image_height',
+    'pub_date',
+    'is_published',
+    'comment_count',
+    'author__username',
+    'category__title',
+    'category__slug',
+    'category__is_published',
+    'location__name',
+    'location__is_published',
+)
+DELETE_POST_FIELDS = (
+    'title',
+    'text',
+    'image',
+    'image_width',
+    'image_height',
+    'pub_date',
+    'author',
+    'location__name',
+    'location__is_published',
+)
+COMMENT_LIST_FIELDS = (
+    'text',
+    'created_at',
+    'comment_post',
+    'author',
+    'author__username',
+)
+PROFILE_USER_FIELDS = (
+    'username',
+    'first_name',
+    'last_name',
+    'date_joined',
+    'is_staff',
+)
+EXACT_COUNT_LIMIT = 10000
+KEYSET_FROM_PAGE = 10
+CACHE_VERSION_KEY = 'blog:version'
+PAGE_CACHE_KEY = 'blog:page:{version}:{hash}'
+PAGE_CACHE_TIMEOUT = 60
+PAGINATOR_COUNT_CACHE_KEY = 'blog:paginator:{hash}'
+CATEGORY_CACHE_KEY = 'blog:category:{slug}'
+CATEGORY_CACHE_TIMEOUT = 300
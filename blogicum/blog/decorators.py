@@ -0,0 +1,116 @@
+import hashlib
+import time
+from functools import wraps
+
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from .constants import PAGE_CACHE_KEY, PAGE_CACHE_TIMEOUT
+from .models import Post
+from .service import get_cache_version, parse_cursor, visible_filter
+
+
+def page_cache_key(request):
+    """
+    Возвращает ключ кэша страницы со списком публикаций.
+
+    Ключ строится из пути страницы и нормализованных параметров пагинации:
+    номера страницы ('page') и курсора ('after', 'after_id'). Остальные
+    параметры запроса (метки рекламных кампаний и т. п.) на страницу не
+    влияют и в ключ не входят, поэтому не создают новых записей в кэше.
+    """
+    page = request.GET.get('page', '1')
+    if page != 'last':
+        try:
+            page = max(int(page), 1)
+        except ValueError:
+            page = 1
+    cursor = parse_cursor(request.GET)
+    if cursor is not None:
+        after, after_id = cursor
+        cursor = f'{after.isoformat()}:{after_id}'
+    return PAGE_CACHE_KEY.format(
+        version=get_cache_version(),
+        hash=hashlib.md5(
+            f'{request.path}:{page}:{cursor}'.encode()).hexdigest(),
+    )
+
+
+def cache_page_for_anonymous(timeout):
+    """
+    Кэширует страницу, отданную представлением анонимному посетителю.
+
+    Для анонимных посетителей страница одинакова, поэтому готовый HTML
+    сохраняется в кэше на 'timeout' секунд и при повторных запросах
+    отдаётся без обращения к базе и рендеринга шаблона. В ключ входят
+    путь и параметры пагинации страницы ('page_cache_key') и версия кэша,
+    которая увеличивается при любом изменении публикаций, комментариев и
+    связанных с ними данных (см. 'bump_cache_version').
+
+    Аутентифицированным пользователям страница показывается с их лайками и
+    меню, поэтому для них, как и для запросов кроме GET, представление
+    вызывается без кэширования. Кэшируются только ответы со статусом 200.
+
+    Версия и страницы хранятся в кэше Django ('CACHES'), поэтому при
+    нескольких процессах сервера он должен быть общим для них (memcached,
+    см. настройки проекта): иначе изменение, обработанное одним процессом,
+    не сбросит страницы, закэшированные другими.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method != 'GET' or request.user.is_authenticated:
+                return view_func(request, *args, **kwargs)
+            key = page_cache_key(request)
+            content = cache.get(key)
+            if content is not None:
+                return HttpResponse(content)
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(key, response.content, timeout)
+            return response
+        return wrapper
+    return decorator
+
+
+def page_etag(request, *args, **kwargs):
+    """
+    Возвращает ETag страницы блога для декоратора 'condition'.
+
+    Страница не меняется, пока не изменились версия кэша блога (данные
+    публикаций, комментариев, лайков и т. п.) и пользователь, для которого
+    она отрисована. Поэтому при совпадении ETag браузер получает ответ
+    304 без запросов к базе и рендеринга шаблона. В ETag также входит
+    номер интервала длиной PAGE_CACHE_TIMEOUT секунд: отложенные публикации
+    появляются со временем без изменения данных.
+    """
+    value = (
+        f'{get_cache_version()}:{request.user.pk}:'
+        f'{int(time.time() // PAGE_CACHE_TIMEOUT)}'
+    )
+    return hashlib.md5(value.encode()).hexdigest()
+
+
+def post_etag(request, post_id):
+    """
+    Возвращает ETag страницы публикации для декоратора 'condition'.
+
+    Кроме значения 'page_etag' в ETag входит состояние самой публикации:
+    дата и статус публикации, статус категории и число комментариев. Если
+    публикация удалена или больше не доступна пользователю (см.
+    'visible_filter'), возвращается None: ответ 304 не отдаётся, и
+    представление возвращает 404.
+    """
+    state = Post.objects.filter(
+        visible_filter(request.user), pk=post_id
+    ).values_list(
+        'pk',
+        'pub_date',
+        'is_published',
+        'category__is_published',
+        'comment_count',
+    ).first()
+    if state is None:
+        return None
+    value = f'{page_etag(request)}:{state}'
+    return hashlib.md5(value.encode()).hexdigest()
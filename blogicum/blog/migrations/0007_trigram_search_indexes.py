@@ -0,0 +1,47 @@
+# Generated by Django 3.2.16 on 2026-10-15 12:30
+
+from django.conf import settings
+from django.db import migrations
+
+# Поиск в админке без префикса '^' использует 'icontains', который Django
+# компилирует в 'UPPER(column) LIKE UPPER(%s)', поэтому индексы строятся по
+# выражению UPPER(column). Индексы нужны только PostgreSQL (pg_trgm).
+TRIGRAM_INDEXES = (
+    ('blog', 'Post', 'title', 'post_title_trgm_idx'),
+    ('blog', 'Category', 'title', 'category_title_trgm_idx'),
+    ('blog', 'Location', 'name', 'location_name_trgm_idx'),
+    (*settings.AUTH_USER_MODEL.split('.'), 'username', 'user_username_trgm_idx'),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for app_label, model_name, column, index_name in TRIGRAM_INDEXES:
+        table = apps.get_model(app_label, model_name)._meta.db_table
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON '
+            f'{schema_editor.quote_name(table)} '
+            f'USING gin (UPPER({schema_editor.quote_name(column)}) '
+            f'gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for *_, index_name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('blog', '0006_post_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 3.2.16 on 2026-10-15 13:00
+
+from django.core.files.images import get_image_dimensions
+from django.db import migrations, models
+
+
+def fill_image_dimensions(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    storage = Post._meta.get_field('image').storage
+    posts = Post.objects.exclude(image='').exclude(image__isnull=True)
+    for pk, name in posts.values_list('pk', 'image'):
+        try:
+            with storage.open(name) as image:
+                width, height = get_image_dimensions(image)
+        except OSError:
+            continue
+        Post.objects.filter(pk=pk).update(
+            image_width=width, image_height=height
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_post_pub_date_is_published_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Высота изображения'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Ширина изображения'),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='image',
+            field=models.ImageField(blank=True, height_field='image_height', null=True, upload_to='posts/', verbose_name='Изображение', width_field='image_width'),
+        ),
+        migrations.RunPython(fill_image_dimensions, migrations.RunPython.noop),
+    ]
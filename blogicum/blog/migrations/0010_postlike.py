@@ -0,0 +1,60 @@
+# Generated by Django 3.2.16 on 2026-10-15 13:20
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('blog', '0009_post_image_dimensions'),
+    ]
+
+    operations = [
+        # Существующая автоматическая таблица связи 'blog_post_likes'
+        # (id, post_id, user_id, UNIQUE(post_id, user_id)) становится
+        # таблицей модели PostLike без копирования данных.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql='ALTER TABLE blog_post_likes RENAME TO blog_postlike',
+                    reverse_sql=(
+                        'ALTER TABLE blog_postlike RENAME TO blog_post_likes'
+                    ),
+                ),
+            ],
+            state_operations=[
+                migrations.CreateModel(
+                    name='PostLike',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='blog.post', verbose_name='Публикация')),
+                        ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='Пользователь')),
+                    ],
+                    options={
+                        'verbose_name': 'лайк',
+                        'verbose_name_plural': 'Лайки',
+                        'unique_together': {('post', 'user')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='post',
+                    name='likes',
+                    field=models.ManyToManyField(blank=True, related_name='liked_posts', through='blog.PostLike', to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name='postlike',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now, verbose_name='Добавлено'),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='postlike',
+            index=models.Index(fields=['user', 'post'], name='postlike_user_post_idx'),
+        ),
+    ]
@@ -1,11 +1,44 @@
 from django.shortcuts import redirect
 
+from .models import Comment
+
 
 class AuthorRequiredMixin:
-    """Миксин, проверяющий, что текущий пользователь является автором."""
+    """
+    Миксин, проверяющий, что текущий пользователь является автором.
+
+    Авторство проверяется по внешнему ключу 'author_id', поэтому запрос к
+    таблице пользователей не нужен. Остальные пользователи перенаправляются
+    на страницу объекта ('get_absolute_url').
+
+    Загруженный в 'dispatch' объект сохраняется в 'self.object' и
+    возвращается из 'get_object', поэтому обработчики 'get'/'post'
+    представления не запрашивают его из базы повторно.
+    """
 
     def dispatch(self, request, *args, **kwargs):
-        post = self.get_object()
-        if post.author != request.user:
-            return redirect('blog:post_detail', post_id=post.pk)
+        self.object = self.get_object()
+        if self.object.author_id != request.user.pk:
+            return redirect(self.object)
         return super().dispatch(request, *args, **kwargs)
+
+    def get_object(self, queryset=None):
+        if queryset is None and getattr(self, 'object', None) is not None:
+            return self.object
+        return super().get_object(queryset)
+
+
+class CommentMixin:
+    """
+    Общие настройки представлений редактирования и удаления комментария.
+
+    Комментарий ищется среди комментариев поста из URL, поэтому
+    несуществующий пост или чужой для него комментарий дают ошибку 404.
+    """
+
+    model = Comment
+    template_name = 'blog/comment.html'
+    pk_url_kwarg = 'comment_id'
+
+    def get_queryset(self):
+        return Comment.objects.filter(comment_post_id=self.kwargs['post_id'])
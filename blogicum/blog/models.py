@@ -1,7 +1,9 @@
+from functools import lru_cache
+
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.urls import reverse
-from django.utils.text import Truncator
 
 from abstract.models import PublishedModel
 from blog.constants import LIMIT_OF_SYMBOLS
@@ -10,6 +12,32 @@ from blog.constants import LIMIT_OF_SYMBOLS
 User = get_user_model()
 
 
+def truncate_words(text, limit=LIMIT_OF_SYMBOLS):
+    """
+    Сокращает текст до 'limit' слов, добавляя многоточие при обрезке.
+
+    Повторяет результат 'Truncator(text).words(limit)' для обычного текста,
+    но без разбора HTML и регулярных выражений: строковое представление
+    объектов вызывается для каждой строки списков в админке и в шаблонах.
+    """
+    words = text.split(None, limit)
+    if len(words) > limit:
+        return ' '.join(words[:limit]) + '…'
+    return ' '.join(words)
+
+
+@lru_cache(maxsize=1024)
+def post_detail_url(post_id):
+    """
+    Возвращает адрес страницы поста 'post_id'.
+
+    На адрес страницы поста перенаправляют почти все действия с постами и
+    комментариями, поэтому результат 'reverse()' запоминается и для
+    повторных обращений к тому же посту разбор маршрутов не выполняется.
+    """
+    return reverse('blog:post_detail', kwargs={'post_id': post_id})
+
+
 class Category(PublishedModel):
     """
     Модель представляет категорию, использующуюся для группировки объектов.
@@ -52,7 +80,7 @@ class Category(PublishedModel):
         verbose_name_plural = 'Категории'
 
     def __str__(self):
-        return Truncator(self.title).words(LIMIT_OF_SYMBOLS)
+        return truncate_words(self.title)
 
 
 class Location(PublishedModel):
@@ -81,7 +109,43 @@ class Location(PublishedModel):
         verbose_name_plural = 'Местоположения'
 
     def __str__(self):
-        return Truncator(self.name).words(LIMIT_OF_SYMBOLS)
+        return truncate_words(self.name)
+
+
+class PostQuerySet(models.QuerySet):
+    """QuerySet публикаций с дополнительными аннотациями."""
+
+    def with_like_state(self, user):
+        """
+        Добавляет к публикациям признак 'is_liked' — поставил ли лайк
+        пользователь 'user'.
+
+        Признак вычисляется подзапросом EXISTS в том же запросе, поэтому
+        шаблону не нужно загружать список лайкнувших для каждой публикации.
+        Для неаутентифицированного пользователя QuerySet не меняется.
+        """
+        if not user.is_authenticated:
+            return self
+        return self.annotate(is_liked=models.Exists(PostLike.objects.filter(
+            post=models.OuterRef('pk'), user=user
+        )))
+
+    def with_likes_count(self):
+        """
+        Добавляет к публикациям количество лайков 'likes_count'.
+
+        Количество считается коррелированным подзапросом, а не 'Count' по
+        соединению с таблицей лайков: основной запрос не группируется, и
+        число его строк не умножается на число лайков.
+        """
+        likes = PostLike.objects.filter(
+            post=models.OuterRef('pk')
+        ).order_by().values('post').annotate(
+            count=models.Count('pk')
+        ).values('count')
+        return self.annotate(likes_count=Coalesce(
+            models.Subquery(likes, output_field=models.IntegerField()), 0
+        ))
 
 
 class Post(PublishedModel):
@@ -93,6 +157,9 @@ class Post(PublishedModel):
         ограничением на длину до 256 символов.
     - image (ImageField): Опциональное поле для добавления изображения.
         Файлы загружаются в папку posts/.
+    - image_width, image_height (PositiveIntegerField): Размеры изображения.
+        Заполняются Django при сохранении, чтобы 'image.width' и
+        'image.height' читались из базы, а не из файла.
     - text (TextField): Основной текст публикации.
     - pub_date (DateTimeField): Дата и время публикации.
         Если указать значение из будущего, публикация станет "отложенной".
@@ -104,6 +171,14 @@ class Post(PublishedModel):
     - category (ForeignKey): Категория публикации, связанная с моделью
         Category. Опциональное поле.
       При удалении категории поле становится NULL (on_delete=models.SET_NULL).
+    - likes (ManyToManyField): Пользователи, поставившие лайк. Связь
+        хранится в модели PostLike.
+    - comment_count (PositiveIntegerField): Количество комментариев к
+        публикации. Не редактируется вручную: поддерживается сигналами
+        создания, переноса и удаления комментариев (blog/signals.py).
+
+    Менеджер 'objects' основан на PostQuerySet и предоставляет методы
+    'with_like_state(user)' и 'with_likes_count()'.
 
     Метаданные (Meta):
     - verbose_name: Читаемое название модели в единственном числе —
@@ -111,9 +186,13 @@ class Post(PublishedModel):
     - verbose_name_plural: Читаемое название модели во множественном числе —
         "Публикации".
     - ordering: По умолчанию публикации сортируются в обратном порядке по дате
-        публикации (-pub_date).
+        публикации (-pub_date), а с одинаковой датой — по убыванию ключа,
+        как и на страницах по курсору.
     - default_related_name: Имя, используемое при автоматическом создании
         обратной связи между моделями.
+    - indexes: Частичный индекс по убыванию даты для опубликованных
+        публикаций (лента), составной индекс категория + дата (страница
+        категории) и индекс по статусу публикации (фильтры в админке).
 
     Методы:
     - __str__: Возвращает сокращённый до заданного количества символов
@@ -124,10 +203,21 @@ class Post(PublishedModel):
     image = models.ImageField(
         upload_to='posts/',
         null=True, blank=True,
+        width_field='image_width',
+        height_field='image_height',
         verbose_name="Изображение"
     )
+    image_width = models.PositiveIntegerField(
+        null=True, blank=True, editable=False,
+        verbose_name='Ширина изображения'
+    )
+    image_height = models.PositiveIntegerField(
+        null=True, blank=True, editable=False,
+        verbose_name='Высота изображения'
+    )
     text = models.TextField(verbose_name='Текст')
     pub_date = models.DateTimeField(
+        db_index=True,
         verbose_name='Дата и время публикации',
         help_text=(
             'Если установить дату и время в будущем — можно '
@@ -153,23 +243,89 @@ class Post(PublishedModel):
         verbose_name='Категория'
     )
     likes = models.ManyToManyField(
-        User, related_name="liked_posts", blank=True
+        User, through='PostLike', related_name="liked_posts", blank=True
     )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        db_index=True,
+        editable=False,
+        verbose_name='Количество комментариев'
+    )
+
+    objects = PostQuerySet.as_manager()
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
-        ordering = ['-pub_date']
+        ordering = ['-pub_date', '-id']
         default_related_name = '%(class)ss'
-
-    def total_likes(self):
-        return self.likes.count()
+        indexes = [
+            models.Index(
+                fields=['-pub_date'],
+                condition=models.Q(is_published=True),
+                name='post_pub_published_idx',
+            ),
+            models.Index(
+                fields=['category', '-pub_date'],
+                name='post_category_pub_date_idx',
+            ),
+            models.Index(
+                fields=['is_published'],
+                name='post_is_published_idx',
+            ),
+        ]
 
     def __str__(self):
-        return Truncator(self.title).words(LIMIT_OF_SYMBOLS)
+        return truncate_words(self.title)
 
     def get_absolute_url(self):
-        return reverse('blog:post_detail', kwargs={'post_id': self.pk})
+        return post_detail_url(self.pk)
+
+
+class PostLike(models.Model):
+    """
+    Лайк публикации пользователем (промежуточная модель для Post.likes).
+
+    Атрибуты:
+        post (ForeignKey): Публикация, которой поставлен лайк.
+        user (ForeignKey): Пользователь, поставивший лайк.
+        created_at (DateTimeField): Дата и время, когда поставлен лайк.
+
+    Метаданные:
+        unique_together: Пользователь может поставить публикации только
+            один лайк; ограничение также служит индексом (post, user).
+        indexes: Индекс (user, post) для выборки публикаций, которые
+            понравились пользователю.
+    """
+
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        verbose_name='Публикация'
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        verbose_name='Пользователь'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Добавлено'
+    )
+
+    class Meta:
+        verbose_name = 'лайк'
+        verbose_name_plural = 'Лайки'
+        unique_together = ('post', 'user')
+        indexes = [
+            models.Index(
+                fields=['user', 'post'],
+                name='postlike_user_post_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f'Лайк пользователя {self.user_id} к посту {self.post_id}'
 
 
 class Comment(PublishedModel):
@@ -195,7 +351,10 @@ class Comment(PublishedModel):
     Методы:
         __str__(): Возвращает строковое представление комментария в виде
             усечённого  текста длиной LIMIT_OF_SYMBOLS слов для краткости
-            отображения.
+            отображения. Автор и пост выводятся по имени и заголовку, если
+            уже загружены, иначе по id, без дополнительных запросов.
+        get_absolute_url(): Возвращает адрес страницы поста, к которому
+            относится комментарий.
     """
 
     text = models.TextField(max_length=256, verbose_name='Комментарий',)
@@ -218,7 +377,22 @@ class Comment(PublishedModel):
         verbose_name_plural = 'Комментарии'
 
     def __str__(self):
-        return Truncator(
-            f'Комментарий автора {self.author} к посту {self.comment_post}, '
+        # Связанные объекты используются, только если уже загружены
+        # (select_related, prefetch_related): иначе их загрузка стоила бы
+        # двух запросов на каждый комментарий, и выводятся их id.
+        author = (
+            self.author.get_username()
+            if Comment.author.is_cached(self) else f'#{self.author_id}'
+        )
+        post = (
+            self.comment_post.title
+            if Comment.comment_post.is_cached(self)
+            else f'#{self.comment_post_id}'
+        )
+        return truncate_words(
+            f'Комментарий автора {author} к посту {post}, '
             f'содержание: {self.text}'
-        ).words(LIMIT_OF_SYMBOLS)
+        )
+
+    def get_absolute_url(self):
+        return post_detail_url(self.comment_post_id)
@@ -0,0 +1,191 @@
+import hashlib
+import json
+from datetime import date
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from .constants import (
+    EXACT_COUNT_LIMIT,
+    KEYSET_FROM_PAGE,
+    PAGINATOR_COUNT_CACHE_KEY,
+)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Пагинатор, который оценивает количество объектов по плану запроса.
+
+    Точный 'SELECT COUNT(*)' по всей выборке на больших таблицах становится
+    самым медленным запросом страницы. Для PostgreSQL количество строк
+    берётся из оценки планировщика ('EXPLAIN (FORMAT JSON)'), которая
+    не требует чтения таблицы.
+
+    Оценка используется только для крупных выборок: если планировщик
+    ожидает меньше EXACT_COUNT_LIMIT строк (например, на странице
+    категории), а также для других СУБД и для списков, не являющихся
+    QuerySet, выполняется обычный точный подсчёт.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = self.estimate_count()
+        if estimate is None or estimate < EXACT_COUNT_LIMIT:
+            return super().count
+        return estimate
+
+    def estimate_count(self):
+        """Возвращает оценку количества строк или None, если её нет."""
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return None
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return None
+        sql, params = self.object_list.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return plan[0]['Plan']['Plan Rows']
+
+
+class CachingPaginator(EstimatedCountPaginator):
+    """
+    Пагинатор, который сохраняет количество объектов в кэше.
+
+    Подсчёт выполняется один раз для одинаковых запросов, после чего на
+    CACHED_PAGINATOR_TIMEOUT секунд (настройка проекта) берётся из кэша.
+    Ключ строится по SQL запроса и его параметрам, кроме дат: условие
+    'pub_date__lte=now()' меняется при каждом запросе, и с ним ключ никогда
+    бы не совпадал. Поэтому отложенная публикация появляется в количестве
+    не позже чем через время хранения записи.
+
+    Аргументы:
+        cache_version: Версия записей в кэше. Если передать версию кэша
+            блога ('get_cache_version'), количество пересчитывается после
+            любого изменения публикаций.
+    """
+
+    def __init__(self, *args, cache_version=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_version = cache_version
+
+    @cached_property
+    def count(self):
+        key = self.get_count_cache_key()
+        if key is None:
+            return super().count
+        count = cache.get(key, version=self.cache_version)
+        if count is None:
+            count = super().count
+            cache.set(
+                key,
+                count,
+                settings.CACHED_PAGINATOR_TIMEOUT,
+                version=self.cache_version,
+            )
+        return count
+
+    def get_count_cache_key(self):
+        """Возвращает ключ кэша для количества или None для списков."""
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return None
+        sql, params = self.object_list.order_by().query.sql_with_params()
+        params = [param for param in params if not isinstance(param, date)]
+        digest = hashlib.md5(f'{sql}{params}'.encode()).hexdigest()
+        return PAGINATOR_COUNT_CACHE_KEY.format(hash=digest)
+
+
+def cursor_query(post):
+    """
+    Возвращает параметры запроса страницы, которая следует за публикацией
+    'post' ('after' — дата публикации, 'after_id' — первичный ключ).
+    """
+    return urlencode({
+        'after': post.pub_date.isoformat(),
+        'after_id': post.pk,
+    })
+
+
+class CursorPage(Page):
+    """
+    Страница пагинатора, ссылка «дальше» с которой на глубоких страницах —
+    курсор.
+
+    До страницы 'keyset_from_page' переход «дальше» ведёт на следующий номер
+    страницы, и на ней остаётся полная навигация по номерам. Начиная с неё
+    переход выполняется по курсору от последней публикации страницы
+    ('paginate_keyset'), и база не пропускает строки предыдущих страниц
+    (OFFSET), число которых растёт с номером страницы. Для пустой страницы
+    (при завышенной оценке количества, см. 'EstimatedCountPaginator')
+    курсора нет, и ссылка тоже ведёт на номер страницы.
+    """
+
+    has_cursor_links = True
+    keyset_from_page = KEYSET_FROM_PAGE
+
+    @property
+    def next_query(self):
+        next_number = self.next_page_number()
+        if next_number < self.keyset_from_page or not len(self):
+            return urlencode({'page': next_number})
+        return cursor_query(self[-1])
+
+
+class CursorPaginator(CachingPaginator):
+    """Пагинатор, страницы которого ссылаются на следующую по курсору."""
+
+    def _get_page(self, *args, **kwargs):
+        return CursorPage(*args, **kwargs)
+
+
+class KeysetPage:
+    """
+    Страница списка публикаций, выбранная по курсору (keyset-пагинация).
+
+    В отличие от 'Page', не знает общего количества объектов и номера
+    страницы: следующая страница начинается после последней публикации
+    текущей, поэтому база не пропускает строки предыдущих страниц (OFFSET).
+
+    Атрибуты:
+        object_list (list): Публикации текущей страницы.
+        cursor (str): Курсор, с которого начинается страница; входит в
+            ключ кэша списка публикаций вместо номера страницы.
+        is_keyset (bool): Признак страницы по курсору для шаблона
+            пагинации.
+
+    Методы:
+        has_next(): Есть ли следующая страница.
+        next_query: Параметры запроса следующей страницы ('cursor_query'
+            от последней публикации).
+    """
+
+    is_keyset = True
+
+    def __init__(self, object_list, has_next, cursor):
+        self.object_list = object_list
+        self._has_next = has_next
+        self.cursor = cursor
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    @property
+    def next_query(self):
+        return cursor_query(self.object_list[-1])
@@ -1,11 +1,25 @@
-from django.core.paginator import Paginator
-from django.db.models import Count
+import time
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Prefetch, Q
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.utils.timezone import now
 
-from .models import Post
+from .constants import (
+    CACHE_VERSION_KEY,
+    CATEGORY_CACHE_KEY,
+    CATEGORY_CACHE_TIMEOUT,
+    COMMENT_LIST_FIELDS,
+    POST_LIST_FIELDS,
+)
+from .models import Category, Comment, Post
+from .paginators import CachingPaginator, CursorPaginator, KeysetPage
 
 
-def paginate(queryset, request, items_per_page):
+def paginate(queryset, request, items_per_page, *, keyset=False):
     """
     Выполняет пагинацию для переданного QuerySet.
 
@@ -19,55 +33,255 @@ def paginate(queryset, request, items_per_page):
             извлекается номер страницы.
         - items_per_page (int): Количество объектов, отображаемых на одной
             странице. По умолчанию используется значение POSTS_LIMIT.
+        - keyset (bool): Разрешить выбор страницы по курсору (параметры
+            'after' и 'after_id', см. 'paginate_keyset'). Тогда и обычные
+            страницы ссылаются на следующую по курсору ('CursorPage').
+            По умолчанию 'False'.
 
     Возвращает:
         - Page: Объект текущей страницы, предоставляемый 'Paginator.get_page()'
+            или 'KeysetPage', если страница выбрана по курсору.
+
+    Общее количество объектов для больших выборок оценивается по плану
+    запроса (см. 'EstimatedCountPaginator') и сохраняется в кэше до
+    следующего изменения данных блога (см. 'CachingPaginator').
+    """
+    if keyset and 'after' in request.GET:
+        page = paginate_keyset(queryset, request, items_per_page)
+        if page is not None:
+            return page
+    paginator_class = CursorPaginator if keyset else CachingPaginator
+    return paginator_class(
+        queryset, items_per_page, cache_version=get_cache_version()
+    ).get_page(request.GET.get('page'))
+
+
+def paginate_keyset(queryset, request, items_per_page):
+    """
+    Возвращает страницу публикаций, следующих за курсором из запроса.
+
+    Курсор — дата публикации ('after') и первичный ключ ('after_id')
+    последней публикации предыдущей страницы. Публикации сортируются по
+    убыванию даты и ключа, а страница выбирается условием
+    'pub_date < after OR (pub_date = after AND id < after_id)', которое
+    использует индекс по дате. Поэтому дальние страницы загружаются так же
+    быстро, как первая, а не после пропуска всех предыдущих строк (OFFSET).
+
+    Параметры:
+        - queryset (QuerySet): Публикации для разбиения на страницы.
+        - request (HttpRequest): Запрос с параметрами курсора.
+        - items_per_page (int): Количество публикаций на странице.
+
+    Возвращает:
+        - KeysetPage: Страница публикаций или None, если курсор в запросе
+            некорректен.
+    """
+    cursor = parse_cursor(request.GET)
+    if cursor is None:
+        return None
+    after, after_id = cursor
+    # Порядок совпадает с 'Meta.ordering' модели Post, поэтому переход
+    # между обычными страницами и страницами по курсору не пропускает и
+    # не повторяет публикации с одинаковой датой.
+    posts = list(queryset.filter(
+        Q(pub_date__lt=after) | Q(pub_date=after, pk__lt=after_id)
+    ).order_by('-pub_date', '-id')[:items_per_page + 1])
+    return KeysetPage(
+        posts[:items_per_page],
+        has_next=len(posts) > items_per_page,
+        cursor=f'{after.isoformat()}:{after_id}',
+    )
+
+
+def parse_cursor(params):
+    """
+    Разбирает курсор страницы из параметров запроса.
+
+    Параметры:
+        - params (QueryDict): Параметры GET-запроса с 'after' (дата и время
+            публикации в формате ISO 8601) и 'after_id' (первичный ключ).
+
+    Возвращает:
+        - tuple: Пара (after, after_id) с датой, приведённой к часовому
+            поясу проекта, или None, если курсора нет, он некорректен или
+            ключ выходит за диапазон первичных ключей публикаций.
+    """
+    try:
+        after = parse_datetime(params['after'])
+        after_id = int(params['after_id'])
+    except (KeyError, ValueError):
+        return None
+    min_id, max_id = connection.ops.integer_field_ranges[
+        Post._meta.pk.get_internal_type()]
+    if after is None or not min_id <= after_id <= max_id:
+        return None
+    if timezone.is_naive(after):
+        after = timezone.make_aware(after)
+    return after, after_id
+
+
+def published_filter():
+    """
+    Возвращает условие отбора опубликованных публикаций.
+
+    Публикация считается опубликованной, если дата её публикации не позже
+    текущего времени, она сама и её категория отмечены как опубликованные.
+
+    Returns:
+        Q: Условие для 'filter()' QuerySet публикаций.
+    """
+    return Q(
+        pub_date__lte=now(),
+        is_published=True,
+        category__is_published=True,
+    )
+
+
+def visible_filter(user):
     """
-    return Paginator(
-        queryset, items_per_page).get_page(request.GET.get('page'))
+    Возвращает условие отбора публикаций, доступных пользователю.
+
+    Всем доступны опубликованные публикации (см. 'published_filter'),
+    аутентифицированному пользователю — также его собственные независимо
+    от статуса публикации.
+
+    Returns:
+        Q: Условие для 'filter()' QuerySet публикаций.
+    """
+    visible = published_filter()
+    if user.is_authenticated:
+        visible |= Q(author=user)
+    return visible
 
 
 def get_filtered_posts(
-        posts=None, apply_filter=True, apply_annotation=True
+        posts=None, *, apply_filter=True, extra_filters=None, for_list=False,
+        prefetch_comments=False, liked_by=None, order_by=None
 ):
     """
     Получает и обрабатывает список публикаций (QuerySet) с применением
-    фильтров и аннотаций.
+    фильтров.
 
     Функция обрабатывает переданный QuerySet публикаций, применяя:
     - Фильтр по дате публикации (только публикации с 'pub_date' не позже
       текущего времени), статусу опубликованности публикации
       ('is_published=True'), а также опубликованности категории
       ('category__is_published=True'), если флаг 'apply_filter' установлен в
-        'True'.
-    - Аннотацию для подсчета количества комментариев к публикации
-      ("Count('comments')"), если флаг `apply_annotation` установлен в 'True'.
+        'True' (см. 'published_filter').
+    - Дополнительные условия из 'extra_filters' (например, категория или
+      автор). Они применяются здесь, до аннотаций и 'prefetch_related':
+      фильтрация уже вычисленного QuerySet в представлении создаёт новый
+      запрос и отбрасывает загруженные заранее связи.
     Затем добавляются связи для связанных моделей ('select_related') для
-    оптимизации запросов.
+    оптимизации запросов и аннотация 'likes_count' с количеством лайков
+    ('PostQuerySet.with_likes_count', подзапрос без группировки), чтобы
+    шаблоны не выполняли отдельный подсчёт для каждой публикации.
+    Количество комментариев хранится в поле 'comment_count' самой
+    публикации, поэтому для него подсчёт не требуется.
+    При 'for_list' из базы загружаются только поля, которые выводятся в
+    карточке публикации (POST_LIST_FIELDS), что уменьшает объём строк для
+    страниц со списками.
+    При 'prefetch_comments' комментарии вместе с их авторами загружаются
+    одним дополнительным запросом (только выводимые поля,
+    COMMENT_LIST_FIELDS), а при 'liked_by' каждая публикация
+    получает признак 'is_liked' ('PostQuerySet.with_like_state').
+    Запрос не группируется (лайки считаются подзапросом, комментарии
+    хранятся в поле), поэтому по умолчанию действует 'Meta.ordering'
+    модели, а 'order_by' применяется, только если его передали.
 
     Args:
         posts (QuerySet): QuerySet публикаций, который нужно обработать.
             По умолчанию используется 'Post.objects'.
         apply_filter (bool): Флаг, указывающий, нужно ли применять
             вышеописанные фильтры к QuerySet. По умолчанию 'True'.
-        apply_annotation (bool): Флаг, указывающий, нужно ли добавлять
-            аннотацию, подсчитывающую количество комментариев. По умолчанию
-            'True'.
+        extra_filters (dict): Дополнительные условия фильтрации в формате
+            аргументов 'filter()'. По умолчанию не применяются.
+        for_list (bool): Флаг, указывающий, что публикации выводятся
+            списком и нужны только поля карточки. По умолчанию 'False' —
+            загружаются все поля.
+        prefetch_comments (bool): Флаг, указывающий, нужно ли загрузить
+            комментарии публикаций с их авторами. По умолчанию 'False'.
+        liked_by (User): Пользователь, для которого отмечаются понравившиеся
+            ему публикации. По умолчанию признак не добавляется.
+        order_by (Iterable[str]): Поля сортировки. По умолчанию
+            используется 'Meta.ordering' модели Post (по убыванию даты).
 
     Returns:
-        QuerySet: Обработанный QuerySet публикаций с примененными фильтрами,
-                  аннотациями (если указано), связанной выборкой и
-                  отсортированный по убыванию даты публикации.
+        QuerySet: Обработанный QuerySet публикаций с примененными фильтрами
+                  (если указано), связанной выборкой, количеством лайков и
+                  отсортированный по 'order_by' (по умолчанию по убыванию
+                  даты публикации).
     """
-    posts = posts or Post.objects.all()
-    time_now = now()
+    if posts is None:
+        posts = Post.objects.all()
     if apply_filter:
-        posts = posts.filter(
-            pub_date__lte=time_now,
-            is_published=True,
-            category__is_published=True)
-    if apply_annotation:
-        posts = posts.annotate(comment_count=Count('comments'))
-    return posts.select_related(
+        posts = posts.filter(published_filter())
+    if extra_filters:
+        posts = posts.filter(**extra_filters)
+    posts = posts.select_related(
         'category', 'location', 'author'
-    ).order_by('-pub_date')
+    ).with_likes_count()
+    if liked_by is not None:
+        posts = posts.with_like_state(liked_by)
+    if for_list:
+        posts = posts.only(*POST_LIST_FIELDS)
+    if prefetch_comments:
+        posts = posts.prefetch_related(Prefetch(
+            'comments',
+            queryset=Comment.objects.select_related('author').only(
+                *COMMENT_LIST_FIELDS),
+        ))
+    if order_by:
+        posts = posts.order_by(*order_by)
+    return posts
+
+
+def get_cache_version():
+    """
+    Возвращает текущую версию закэшированных страниц блога.
+
+    Версия входит в ключи кэша страниц со списками публикаций. Если ключа
+    версии в кэше нет (первый запуск или вытеснение), он создаётся со
+    значением текущего времени в наносекундах, поэтому новая версия всегда
+    больше любой из ранее выданных.
+    """
+    version = cache.get(CACHE_VERSION_KEY)
+    if version is None:
+        cache.add(CACHE_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(CACHE_VERSION_KEY)
+    return version
+
+
+def bump_cache_version():
+    """
+    Увеличивает версию кэша, делая недействительными все ранее сохранённые
+    страницы. Инвалидация выполняется за одну операцию с кэшем.
+    """
+    try:
+        cache.incr(CACHE_VERSION_KEY)
+    except ValueError:
+        cache.add(CACHE_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def get_published_category(slug):
+    """
+    Возвращает опубликованную категорию по слагу.
+
+    Категории меняются редко, поэтому найденная категория сохраняется в
+    кэше на CATEGORY_CACHE_TIMEOUT секунд. Запись удаляется сигналами при
+    изменении и удалении категории (см. 'blog/signals.py').
+
+    Raises:
+        Http404: Если категория не найдена или не опубликована.
+    """
+    key = CATEGORY_CACHE_KEY.format(slug=slug)
+    category = cache.get(key)
+    if category is None:
+        category = get_object_or_404(Category, slug=slug, is_published=True)
+        cache.set(key, category, CATEGORY_CACHE_TIMEOUT)
+    return category
+
+
+def forget_category(slug):
+    """Удаляет категорию со слагом 'slug' из кэша."""
+    cache.delete(CATEGORY_CACHE_KEY.format(slug=slug))
@@ -0,0 +1,139 @@
+from django.db.models import F
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from .models import Category, Comment, Location, Post, PostLike, User
+from .service import bump_cache_version, forget_category
+
+
+def change_comment_count(post_id, delta):
+    """
+    Изменяет счётчик комментариев публикации 'post_id' на 'delta'.
+
+    Счётчик обновляется выражением F() прямо в базе данных, поэтому
+    одновременное изменение нескольких комментариев не теряет изменений.
+    """
+    Post.objects.filter(pk=post_id).update(
+        comment_count=F('comment_count') + delta
+    )
+
+
+@receiver(pre_save, sender=Comment)
+def remember_comment_post(sender, instance, raw, **kwargs):
+    """
+    Запоминает публикацию, к которой комментарий относился до сохранения.
+
+    В админке комментарий можно перенести к другой публикации, и тогда
+    счётчики нужно изменить у обеих (см. 'update_comment_count').
+    """
+    instance._previous_post_id = None
+    if raw or instance.pk is None:
+        return
+    instance._previous_post_id = Comment.objects.filter(
+        pk=instance.pk
+    ).values_list('comment_post_id', flat=True).first()
+
+
+@receiver(post_save, sender=Comment)
+def update_comment_count(sender, instance, created, raw, **kwargs):
+    """
+    Обновляет счётчики комментариев публикаций после сохранения комментария.
+
+    Новый комментарий увеличивает счётчик своей публикации, а перенос
+    комментария к другой публикации уменьшает счётчик прежней и
+    увеличивает счётчик новой. При загрузке фикстур (raw=True) значение
+    берётся из самой фикстуры.
+    """
+    if raw:
+        return
+    previous_post_id = getattr(instance, '_previous_post_id', None)
+    if created:
+        change_comment_count(instance.comment_post_id, 1)
+    elif previous_post_id not in (None, instance.comment_post_id):
+        change_comment_count(previous_post_id, -1)
+        change_comment_count(instance.comment_post_id, 1)
+
+
+@receiver(post_delete, sender=Comment)
+def decrease_comment_count(sender, instance, **kwargs):
+    """Уменьшает счётчик комментариев публикации при удалении комментария."""
+    change_comment_count(instance.comment_post_id, -1)
+
+
+@receiver(pre_save, sender=Category)
+def forget_renamed_category(sender, instance, raw, **kwargs):
+    """
+    Удаляет из кэша категорию под прежним слагом, если слаг меняется.
+
+    После переименования старый адрес категории не должен открываться
+    по записи, оставшейся в кэше.
+    """
+    if raw or instance.pk is None:
+        return
+    old_slug = Category.objects.filter(
+        pk=instance.pk
+    ).values_list('slug', flat=True).first()
+    if old_slug is not None and old_slug != instance.slug:
+        forget_category(old_slug)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_cache(sender, instance, **kwargs):
+    """Удаляет изменённую или удалённую категорию из кэша."""
+    forget_category(instance.slug)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+@receiver(post_save, sender=PostLike)
+@receiver(post_delete, sender=PostLike)
+@receiver(m2m_changed, sender=PostLike)
+def invalidate_pages_cache(sender, **kwargs):
+    """
+    Сбрасывает кэш страниц блога при изменении отображаемых на них данных.
+
+    Помимо публикаций и комментариев, на карточках выводятся категория,
+    местоположение, имя автора и лайки, поэтому их изменения тоже
+    увеличивают версию кэша. Изменения пользователей обрабатывает
+    'invalidate_pages_cache_on_rename'.
+    """
+    bump_cache_version()
+
+
+@receiver(pre_save, sender=User)
+def remember_username(sender, instance, raw, update_fields, **kwargs):
+    """
+    Запоминает имя пользователя до сохранения.
+
+    Из данных пользователя на страницах блога выводится только имя, а
+    пользователь сохраняется и при каждом входе ('last_login'), поэтому
+    прежнее имя запрашивается, только если оно может измениться.
+    """
+    instance._previous_username = None
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and 'username' not in update_fields:
+        return
+    instance._previous_username = User.objects.filter(
+        pk=instance.pk
+    ).values_list('username', flat=True).first()
+
+
+@receiver(post_save, sender=User)
+def invalidate_pages_cache_on_rename(sender, instance, raw, **kwargs):
+    """Сбрасывает кэш страниц блога, если изменилось имя пользователя."""
+    previous = getattr(instance, '_previous_username', None)
+    if not raw and previous is not None and previous != instance.username:
+        bump_cache_version()
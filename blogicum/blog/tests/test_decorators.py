@@ -0,0 +1,28 @@
+from django.test import RequestFactory, SimpleTestCase
+
+from blog.decorators import page_cache_key
+
+
+class PageCacheKeyTest(SimpleTestCase):
+    """Ключ кэша страницы зависит только от параметров пагинации."""
+
+    def key(self, path, query=None):
+        return page_cache_key(RequestFactory().get(path, query or {}))
+
+    def test_unrelated_parameters_share_key(self):
+        self.assertEqual(
+            self.key('/', {'page': '2'}),
+            self.key('/', {'page': '2', 'utm_source': 'mail', 'x': '1'}),
+        )
+
+    def test_invalid_page_is_first_page(self):
+        self.assertEqual(self.key('/'), self.key('/', {'page': 'abc'}))
+        self.assertEqual(self.key('/'), self.key('/', {'page': '1'}))
+
+    def test_pagination_changes_key(self):
+        self.assertNotEqual(self.key('/'), self.key('/', {'page': '2'}))
+        self.assertNotEqual(
+            self.key('/'),
+            self.key('/', {'after': '2024-05-01T10:00:00', 'after_id': '3'}),
+        )
+        self.assertNotEqual(self.key('/'), self.key('/category/news/'))
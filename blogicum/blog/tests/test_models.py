@@ -0,0 +1,47 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from blog.models import Category, Comment, Post, User
+
+
+class CommentStrTest(TestCase):
+    """Строковое представление комментария не загружает связанные объекты."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author')
+        category = Category.objects.create(
+            title='Категория', description='Описание', slug='category'
+        )
+        post = Post.objects.create(
+            title='Публикация',
+            text='Текст',
+            pub_date=timezone.now(),
+            author=cls.author,
+            category=category,
+        )
+        cls.comment = Comment.objects.create(
+            text='Комментарий', comment_post=post, author=cls.author
+        )
+
+    def test_without_related_objects(self):
+        comment = Comment.objects.get(pk=self.comment.pk)
+        with self.assertNumQueries(0):
+            text = str(comment)
+        self.assertEqual(
+            text,
+            f'Комментарий автора #{self.author.pk} к посту '
+            f'#{self.comment.comment_post_id}, содержание: Комментарий',
+        )
+
+    def test_with_related_objects(self):
+        comment = Comment.objects.select_related(
+            'author', 'comment_post'
+        ).get(pk=self.comment.pk)
+        with self.assertNumQueries(0):
+            text = str(comment)
+        self.assertEqual(
+            text,
+            'Комментарий автора author к посту Публикация, '
+            'содержание: Комментарий',
+        )
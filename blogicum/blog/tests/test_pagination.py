@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
+from django.core.paginator import Paginator
+from django.http import QueryDict
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from blog.models import Category, Post, User
+from blog.paginators import CursorPage, KeysetPage
+from blog.service import paginate, paginate_keyset, parse_cursor
+
+
+class ParseCursorTest(TestCase):
+    """Разбор курсора страницы из параметров запроса."""
+
+    def test_valid_cursor(self):
+        after, after_id = parse_cursor(
+            QueryDict('after=2024-05-01T10:00:00%2B00:00&after_id=7'))
+        self.assertEqual(
+            after, datetime(2024, 5, 1, 10, tzinfo=timezone.utc))
+        self.assertEqual(after_id, 7)
+
+    def test_naive_date_gets_project_timezone(self):
+        after, _ = parse_cursor(
+            QueryDict('after=2024-05-01T10:00:00&after_id=7'))
+        self.assertTrue(timezone.is_aware(after))
+
+    def test_invalid_cursors(self):
+        for query in (
+            '',
+            'after=2024-05-01T10:00:00',
+            'after_id=7',
+            'after=yesterday&after_id=7',
+            'after=2024-13-45T10:00:00&after_id=7',
+            'after=2024-05-01T10:00:00&after_id=seven',
+            'after=2024-05-01T10:00:00&after_id=99999999999999999999999',
+        ):
+            with self.subTest(query=query):
+                self.assertIsNone(parse_cursor(QueryDict(query)))
+
+
+class KeysetPaginationTest(TestCase):
+    """Страницы по курсору продолжают обычные страницы без пропусков."""
+
+    per_page = 3
+
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user('author')
+        category = Category.objects.create(
+            title='Категория', description='Описание', slug='category'
+        )
+        now = timezone.now()
+        # Несколько публикаций с одинаковой датой попадают на границу
+        # страниц, поэтому порядок между ними задаёт первичный ключ.
+        pub_dates = [now - timedelta(hours=1)] * 5 + [
+            now - timedelta(hours=hours) for hours in range(2, 6)
+        ]
+        for number, pub_date in enumerate(pub_dates):
+            Post.objects.create(
+                title=f'Публикация {number}',
+                text='Текст',
+                pub_date=pub_date,
+                author=author,
+                category=category,
+            )
+        cls.ordered = list(Post.objects.all())
+
+    def get_request(self, query=''):
+        return RequestFactory().get('/', QueryDict(query))
+
+    def walk(self):
+        page = paginate(
+            Post.objects.all(), self.get_request(), self.per_page,
+            keyset=True,
+        )
+        pages = [page]
+        while page.has_next():
+            page = paginate(
+                Post.objects.all(), self.get_request(page.next_query),
+                self.per_page, keyset=True,
+            )
+            pages.append(page)
+        return pages
+
+    def test_numbered_pages_link_to_next_number(self):
+        pages = self.walk()
+        self.assertEqual(sum(map(list, pages), []), self.ordered)
+        self.assertEqual([page.number for page in pages], [1, 2, 3])
+
+    @mock.patch.object(CursorPage, 'keyset_from_page', 3)
+    def test_deep_pages_link_by_cursor(self):
+        pages = self.walk()
+        self.assertEqual(sum(map(list, pages), []), self.ordered)
+        self.assertEqual(pages[1].next_query[:6], 'after=')
+        self.assertIsInstance(pages[2], KeysetPage)
+
+    def test_empty_page_links_by_number(self):
+        # Оценка количества может быть завышена, и страница с номером
+        # в пределах оценки окажется пустой.
+        page = CursorPage([], 12, Paginator(range(100), self.per_page))
+        self.assertTrue(page.has_next())
+        self.assertEqual(page.next_query, 'page=13')
+
+    def test_boundary_inside_same_pub_date(self):
+        last = self.ordered[1]
+        self.assertEqual(last.pub_date, self.ordered[2].pub_date)
+        page = paginate_keyset(
+            Post.objects.all(),
+            self.get_request(
+                f'after={last.pub_date.isoformat()}&after_id={last.pk}'
+                .replace('+', '%2B')),
+            self.per_page,
+        )
+        self.assertEqual(list(page), self.ordered[2:5])
+        self.assertTrue(page.has_next())
+
+    def test_last_page_has_no_next(self):
+        last = self.ordered[5]
+        page = paginate_keyset(
+            Post.objects.all(),
+            self.get_request(
+                f'after={last.pub_date.isoformat()}&after_id={last.pk}'
+                .replace('+', '%2B')),
+            self.per_page,
+        )
+        self.assertEqual(list(page), self.ordered[6:])
+        self.assertFalse(page.has_next())
+
+    def test_bad_cursor_falls_back_to_numbered_page(self):
+        page = paginate(
+            Post.objects.all(),
+            self.get_request(
+                'after=2024-05-01T10:00:00&after_id=99999999999999999999999'),
+            self.per_page,
+            keyset=True,
+        )
+        self.assertNotIsInstance(page, KeysetPage)
+        self.assertEqual(page.number, 1)
+        self.assertEqual(list(page), self.ordered[:3])
+
+    def test_bad_cursor_on_index_page(self):
+        response = self.client.get(
+            '/', {'after': '2020-01-01T00:00:00',
+                  'after_id': '99999999999999999999999'})
+        self.assertEqual(response.status_code, 200)
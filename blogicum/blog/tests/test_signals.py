@@ -0,0 +1,88 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from blog.models import Category, Comment, Post, User
+from blog.service import get_cache_version
+
+
+class CommentCountTest(TestCase):
+    """Счётчик комментариев публикации поддерживается сигналами."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author')
+        category = Category.objects.create(
+            title='Категория', description='Описание', slug='category'
+        )
+        cls.first, cls.second = (
+            Post.objects.create(
+                title=title,
+                text='Текст',
+                pub_date=timezone.now(),
+                author=cls.author,
+                category=category,
+            )
+            for title in ('Первый', 'Второй')
+        )
+
+    def assert_comment_counts(self, first, second):
+        self.first.refresh_from_db()
+        self.second.refresh_from_db()
+        self.assertEqual(
+            (self.first.comment_count, self.second.comment_count),
+            (first, second),
+        )
+
+    def create_comment(self, post):
+        return Comment.objects.create(
+            text='Комментарий', comment_post=post, author=self.author
+        )
+
+    def test_create_and_delete(self):
+        comment = self.create_comment(self.first)
+        self.create_comment(self.first)
+        self.assert_comment_counts(2, 0)
+        comment.delete()
+        self.assert_comment_counts(1, 0)
+
+    def test_edit_keeps_count(self):
+        comment = self.create_comment(self.first)
+        comment.text = 'Изменённый комментарий'
+        comment.save()
+        self.assert_comment_counts(1, 0)
+
+    def test_move_to_another_post(self):
+        comment = self.create_comment(self.first)
+        self.create_comment(self.first)
+        comment.comment_post = self.second
+        comment.save()
+        self.assert_comment_counts(1, 1)
+        comment.delete()
+        self.assert_comment_counts(1, 0)
+
+
+class UserCacheVersionTest(TestCase):
+    """Версия кэша страниц меняется только при смене имени пользователя."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('author', password='password')
+
+    def test_login_keeps_version(self):
+        version = get_cache_version()
+        self.assertTrue(
+            self.client.login(username='author', password='password')
+        )
+        self.assertEqual(get_cache_version(), version)
+
+    def test_profile_edit_keeps_version(self):
+        version = get_cache_version()
+        self.user.first_name = 'Имя'
+        self.user.save()
+        self.assertEqual(get_cache_version(), version)
+
+    def test_rename_changes_version(self):
+        version = get_cache_version()
+        self.user.username = 'writer'
+        self.user.save()
+        self.assertNotEqual(get_cache_version(), version)
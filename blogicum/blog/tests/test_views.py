@@ -0,0 +1,55 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from blog.models import Category, Post, User
+
+
+class PostDetailEtagTest(TestCase):
+    """Ответ 304 на странице публикации учитывает её состояние."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author')
+        category = Category.objects.create(
+            title='Категория', description='Описание', slug='category'
+        )
+        cls.post = Post.objects.create(
+            title='Публикация',
+            text='Текст',
+            pub_date=timezone.now() - timedelta(days=1),
+            author=cls.author,
+            category=category,
+        )
+        cls.url = reverse('blog:post_detail', args=(cls.post.pk,))
+
+    def etag(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response['ETag']
+
+    def test_unchanged_post_not_modified(self):
+        etag = self.etag()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_hidden_post_not_found(self):
+        etag = self.etag()
+        # update() не вызывает сигналы, и версия кэша блога не меняется.
+        Post.objects.filter(pk=self.post.pk).update(is_published=False)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 404)
+
+    def test_deleted_post_not_found(self):
+        etag = self.etag()
+        self.post.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 404)
+
+    def test_changed_post_modified(self):
+        etag = self.etag()
+        Post.objects.filter(pk=self.post.pk).update(comment_count=1)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
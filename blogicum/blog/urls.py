@@ -7,26 +7,32 @@ app_name = 'blog'
 
 
 posts_url = [
-    path('<int:post_id>/like/', views.like_post, name='like_post'),
-    path('create/', views.PostCreateView.as_view(), name='create_post'),
     path(
         '<int:post_id>/',
         views.PostDetailView.as_view(),
         name='post_detail'
     ),
+    path('<int:post_id>/like/', views.like_post, name='like_post'),
+    path('<int:post_id>/comment/', views.add_comment, name='add_comment'),
+    path('create/', views.PostCreateView.as_view(), name='create_post'),
     path(
-        '<int:pk>/edit/',
+        '<int:post_id>/edit/',
         views.PostUpdateView.as_view(),
         name='edit_post'
     ),
-    path('<int:post_id>/delete/', views.delete_post, name='delete_post'),
-    path('<int:post_id>/comment/', views.add_comment, name='add_comment'),
+    path(
+        '<int:post_id>/delete/',
+        views.PostDeleteView.as_view(),
+        name='delete_post'
+    ),
     path(
         '<int:post_id>/comment/<int:comment_id>/edit_comment/',
-        views.edit_comment, name='edit_comment'),
+        views.CommentUpdateView.as_view(),
+        name='edit_comment'
+    ),
     path(
         '<int:post_id>/comment/<int:comment_id>/delete_comment/',
-        views.edit_comment,
+        views.CommentDeleteView.as_view(),
         name='delete_comment'
     ),
 ]
@@ -37,12 +43,12 @@ profile_url = [
 ]
 
 urlpatterns = [
-    path('profile/', include(profile_url)),
+    path('', views.index, name='index'),
     path('posts/', include(posts_url)),
     path(
         'category/<slug:category_slug>/',
         views.category_posts,
         name='category_posts'
     ),
-    path('', views.index, name='index'),
+    path('profile/', include(profile_url)),
 ]
@@ -1,33 +1,44 @@
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.forms import PasswordChangeForm
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import JsonResponse
+from django.http import HttpResponseRedirect, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
-from django.urls import reverse
-from django.views.generic import CreateView, DetailView, UpdateView
-
-from .constants import POSTS_LIMIT
+from django.urls import reverse, reverse_lazy
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from django.views.generic import CreateView, DeleteView, DetailView, UpdateView
+
+from .constants import (
+    DELETE_POST_FIELDS,
+    PAGE_CACHE_TIMEOUT,
+    POSTS_LIMIT,
+    PROFILE_USER_FIELDS,
+)
+from .decorators import cache_page_for_anonymous, page_etag, post_etag
 from .forms import CommentForm, PostCreateForm, ProfileEditForm
-from .mixins import AuthorRequiredMixin
-from .models import Category, Comment, Post, User
-from .service import get_filtered_posts, paginate
+from .mixins import AuthorRequiredMixin, CommentMixin
+from .models import Post, PostLike, User, post_detail_url
+from .service import (
+    get_cache_version,
+    get_filtered_posts,
+    get_published_category,
+    paginate,
+    visible_filter,
+)
 
 
 @login_required
 def like_post(request, post_id):
     if request.method == 'POST':
-        post = get_object_or_404(Post, id=post_id)
-        liked = False
-
-        if request.user in post.likes.all():
-            post.likes.remove(request.user)
-        else:
-            post.likes.add(request.user)
-            liked = True
+        post = get_object_or_404(Post.objects.only('id'), id=post_id)
+        like, liked = PostLike.objects.get_or_create(
+            post=post, user=request.user)
+        if not liked:
+            like.delete()
 
         return JsonResponse({
             'liked': liked,
-            'total_likes': post.total_likes(),
+            'total_likes': post.likes.count(),
         })
 
     return JsonResponse({'error': 'Invalid request'}, status=400)
@@ -44,6 +55,11 @@ def profile(request, username):
     только опубликованные посты). Результат работы функции передается
     в пагинатор и отображается в шаблоне профиля.
 
+    Публикации выбираются одним QuerySet, а у пользователя загружаются
+    только поля, которые выводятся в шаблоне (PROFILE_USER_FIELDS).
+    Признак 'is_owner' вычисляется один раз и передаётся в шаблон для
+    вывода ссылок на редактирование профиля и смену пароля.
+
     Args:
         request (HttpRequest): Объект HTTP-запроса.
         username (str): Имя пользователя (username), для которого
@@ -53,13 +69,22 @@ def profile(request, username):
         HttpResponse: Сгенерированный HTML-ответ с данными профиля
                       и перечнем публикаций, разделенных на страницы.
     """
-    user = get_object_or_404(User, username=username)
-    post = get_filtered_posts(
-        posts=user.posts, apply_filter=request.user != user)
-    page_obj = paginate(post, request, POSTS_LIMIT)
+    user = get_object_or_404(
+        User.objects.only(*PROFILE_USER_FIELDS), username=username)
+    # Анонимный пользователь не равен ни одному User, отдельная проверка
+    # аутентификации не нужна.
+    is_owner = request.user == user
+    posts = get_filtered_posts(
+        apply_filter=not is_owner,
+        extra_filters={'author': user},
+        for_list=True,
+        liked_by=request.user,
+    )
+    page_obj = paginate(posts, request, POSTS_LIMIT)
     return render(request, 'blog/profile.html', {
         'profile': user,
         'page_obj': page_obj,
+        'is_owner': is_owner,
     })
 
 
@@ -86,13 +111,13 @@ def edit_profile(request):
             - В случае GET-запроса или ошибки в форме отображается страница с
                 формой редактирования профиля.
     """
-    form = ProfileEditForm(request.POST or None, instance=request.user)
-    if form.is_valid():
-        form.save()
-        return redirect('blog:profile', username=request.user.username)
+    if request.method == 'POST':
+        form = ProfileEditForm(request.POST, instance=request.user)
+        if form.is_valid():
+            form.save()
+            return redirect('blog:profile', username=request.user.username)
     else:
         form = ProfileEditForm(instance=request.user)
-
     return render(request, 'blog/user.html', {'form': form})
 
 
@@ -125,13 +150,16 @@ def change_password_view(request, username):
     user = get_object_or_404(User, username=username)
     if request.user != user:
         return redirect('blog:profile', username=user.username)
-    form = PasswordChangeForm(user, request.POST or None)
-    if form.is_valid():
-        user = form.save()
-        return redirect(
-            'registration:password_change_done',
-            username=user.username
-        )
+    if request.method == 'POST':
+        form = PasswordChangeForm(user, request.POST)
+        if form.is_valid():
+            user = form.save()
+            return redirect(
+                'registration:password_change_done',
+                username=user.username
+            )
+    else:
+        form = PasswordChangeForm(user)
     return render(request, 'change_password.html', {'form': form})
 
 
@@ -200,6 +228,10 @@ class PostUpdateView(LoginRequiredMixin, AuthorRequiredMixin, UpdateView):
         'Create'.
     - template_name: Шаблон HTML, используемый для отображения страницы
         редактирования поста.
+    - pk_url_kwarg: Имя параметра URL с первичным ключом поста ('post_id',
+        как и в остальных адресах постов).
+    - extra_context: Признак 'is_edit', по которому общий с созданием и
+        удалением шаблон выводит заголовок страницы редактирования.
 
     Методы:
     - get_success_url: Возвращает URL для перенаправления после успешного
@@ -209,44 +241,53 @@ class PostUpdateView(LoginRequiredMixin, AuthorRequiredMixin, UpdateView):
     model = Post
     form_class = PostCreateForm
     template_name = 'blog/create.html'
+    pk_url_kwarg = 'post_id'
+    extra_context = {'is_edit': True}
 
 
-@login_required
-def delete_post(request, post_id):
+class PostDeleteView(LoginRequiredMixin, AuthorRequiredMixin, DeleteView):
     """
-    Удаление поста.
+    Представление для удаления поста.
 
-    Это представление обрабатывает процесс удаления поста. Пользователь должен
-    быть аутентифицирован, чтобы иметь доступ к этой функции. Только автор
-    поста или пользователь с правами админа (staff) может удалить пост. Если
-    текущий пользователь не соответствует этим критериям, он будет
-    перенаправлен на страницу этого поста.
+    Удалить пост может только его автор: остальные пользователи
+    перенаправляются на страницу поста, неаутентифицированные — на страницу
+    входа. На GET-запрос отображается страница подтверждения, на POST-запрос
+    пост удаляется и выполняется перенаправление на главную страницу.
 
-    Аргументы:
-        request (HttpRequest): HTTP-запрос от клиента.
-        pk (int): Первичный ключ поста, который требуется удалить.
-
-    Поведение:
-        - Если пользователь не является автором поста и не обладает статусом
-            staff, то происходит перенаправление на страницу этого поста.
-        - Если запрос отправлен с методом POST, пост удаляется, после чего
-            происходит перенаправление на главную страницу блога.
-        - Если запрос отправлен с методом GET, возвращается форма для
-            подтверждения действия.
-    Возвращает:
-        HttpResponse: Ответ с отрисованной формой для GET-запроса или
-            перенаправление на другую страницу после действий.
+    Атрибуты класса:
+    - queryset: Посты вместе с местоположением, которое выводится на
+        странице подтверждения, — одним запросом и только с выводимыми
+        полями (DELETE_POST_FIELDS).
+    - template_name: Шаблон страницы подтверждения удаления.
+    - pk_url_kwarg: Имя параметра URL с первичным ключом поста.
+    - success_url: URL для перенаправления после удаления.
+    - extra_context: Признак 'is_delete', по которому общий с созданием и
+        редактированием шаблон выводит удаляемую публикацию ('post') вместо
+        формы.
+
+    Методы:
+    - get_queryset: При POST-запросе ограничивает выборку постами текущего
+        пользователя, поэтому чужой пост не загружается, а запрос на его
+        удаление завершается ошибкой 404.
     """
-    post = get_object_or_404(Post, pk=post_id)
-    if request.user != post.author:
-        return redirect('blog:post_detail', post_id=post.pk)
-    if request.method == "POST":
-        post.delete()
-        return redirect('blog:index')
-    form = PostCreateForm(instance=post)
-    return render(request, 'blog/create.html', {'form': form})
+
+    queryset = Post.objects.select_related('location').only(
+        *DELETE_POST_FIELDS)
+    template_name = 'blog/create.html'
+    pk_url_kwarg = 'post_id'
+    success_url = reverse_lazy('blog:index')
+    extra_context = {'is_delete': True}
+
+    def get_queryset(self):
+        if self.request.method == 'POST':
+            # Для удаления нужны только ключи: автор проверяется в запросе.
+            return Post.objects.filter(
+                author=self.request.user
+            ).only('id', 'author_id')
+        return super().get_queryset()
 
 
+@method_decorator(condition(etag_func=post_etag), name='dispatch')
 class PostDetailView(DetailView):
     """
     Представление для отображения деталей конкретного объекта модели Post.
@@ -262,22 +303,26 @@ class PostDetailView(DetailView):
         template_name (str): Имя шаблона, используемого для отображения
             деталей поста.
 
+    Ответ содержит ETag ('post_etag'): если ни данные блога, ни сам пост,
+    ни пользователь не изменились, на повторный запрос возвращается ответ
+    304. Ответ 304 возвращается только для поста, доступного пользователю.
+
     Методы:
         get_queryset():
-            Возвращает отфильтрованный QuerySet постов в зависимости от статуса
-            аутентификации пользователя. Аутентифицированные пользователи могут
-            видеть посты, написанные ими, опубликованные посты, посты в
-            опубликованных категориях или посты с прошедшей датой публикации.
-            Неаутентифицированные пользователи могут видеть только
-            опубликованные посты в опубликованных категориях с прошедшей датой
-            публикации.
+            Возвращает QuerySet постов, в котором автор, категория и
+            местоположение загружаются одним запросом вместе с постом, а
+            комментарии с их авторами — одним дополнительным запросом.
+            Отбор по статусу публикации выполняется в 'get_object'.
 
         get_object():
             Получает конкретный объект Post на основе параметра 'post_id' из
-            URL. Если пользователь аутентифицирован, сначала проверяется, есть
-            ли пост, связанный с этим пользователем. Если нет, возвращается
-            ошибка 404 для постов, которые не опубликованы или не
-            соответствуют другим критериям доступности.
+            URL, выбирая его из 'get_queryset()' одним запросом.
+            Аутентифицированные пользователи могут видеть посты, написанные
+            ими, а также все опубликованные посты в опубликованных категориях
+            с прошедшей датой публикации (см. 'visible_filter'); для
+            остальных пользователей условие по автору не добавляется.
+            Иначе возвращается ошибка 404 для постов, которые не опубликованы
+            или не соответствуют другим критериям доступности.
 
         get_context_data(**kwargs):
             Добавляет дополнительные данные в контекст, передаваемый в шаблон.
@@ -288,29 +333,27 @@ class PostDetailView(DetailView):
     model = Post
     template_name = 'blog/detail.html'
 
+    def get_queryset(self):
+        return get_filtered_posts(
+            apply_filter=False,
+            prefetch_comments=True,
+            liked_by=self.request.user,
+        )
+
     def get_object(self):
-        posts = super().get_queryset()
-        post_id = self.kwargs.get('post_id')
-        user = self.request.user
-        if self.request.user.is_authenticated:
-            posts = posts.filter(id=post_id, author=user).first()
-            if posts:
-                return posts
-        # далее возврат объекта отфильтрованного по критериям
         return get_object_or_404(
-            get_filtered_posts(
-                posts, apply_filter=True,
-                apply_annotation=False
-            ),
-            id=post_id
+            self.get_queryset(),
+            visible_filter(self.request.user),
+            id=self.kwargs.get('post_id'),
         )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['form'] = CommentForm()
-        context['comments'] = (
-            self.object.comments.select_related('author')
-        )
+        # Форма комментария выводится только аутентифицированным
+        # пользователям, остальным её не нужно создавать.
+        if self.request.user.is_authenticated:
+            context['form'] = CommentForm()
+        context['comments'] = self.object.comments.all()
         return context
 
 
@@ -341,7 +384,7 @@ def add_comment(request, post_id):
                 - Сохранённый комментарий связывается с выбранным постом и
                     текущим автором (пользователем).
                 - Пользователь перенаправляется на детальную страницу поста
-                    через 'redirect'.
+                    ('post_detail_url').
             2. Если форма не валидна, остаётся текущая форма с ошибками.
         - Если метод запроса — GET, пользователю отображается пустая форма для
             добавления комментария.
@@ -349,7 +392,8 @@ def add_comment(request, post_id):
     Шаблон:
         Используется шаблон `'blog/comment.html' для отображения страницы с
         формой добавления комментария. Шаблон должен содержать форму 'form'
-        для ввода комментария и информацию о посте 'post'.
+        для ввода комментария и информацию о посте 'post'; признак 'is_add'
+        выбирает заголовок страницы добавления.
 
     Исключительные случаи:
         - Если пост с указанным PK не существует, генерируется ошибка 404 с
@@ -363,86 +407,75 @@ def add_comment(request, post_id):
         или перенаправляет на детальную страницу поста после успешного
         добавления комментария.
     """
-    post = get_object_or_404(Post, pk=post_id)
-    form = CommentForm(request.POST or None)
-    if form.is_valid():
-        comment = form.save(commit=False)
-        comment.comment_post = post
-        comment.author = request.user
-        comment.save()
-        return redirect('blog:post_detail', post_id=post.pk)
-    return render(request, 'blog/comment.html', {'form': form, 'post': post})
-
-
-def edit_comment(request, post_id, comment_id):
+    # Пост нужен только для внешнего ключа комментария и адреса
+    # перенаправления, поэтому остальные его поля не загружаются.
+    post = get_object_or_404(Post.objects.only('id'), pk=post_id)
+    if request.method == 'POST':
+        form = CommentForm(request.POST)
+        if form.is_valid():
+            comment = form.save(commit=False)
+            comment.comment_post = post
+            comment.author = request.user
+            comment.save()
+            return HttpResponseRedirect(post_detail_url(post.pk))
+    else:
+        form = CommentForm()
+    return render(
+        request,
+        'blog/comment.html',
+        {'form': form, 'post': post, 'is_add': True},
+    )
+
+
+class CommentUpdateView(
+    LoginRequiredMixin, AuthorRequiredMixin, CommentMixin, UpdateView
+):
     """
-    Обработчик для редактирования или удаления комментария.
+    Представление для редактирования комментария.
 
-    Этот метод позволяет автору комментария редактировать или удалять свой
-    комментарий, связанный с определённым постом. Попытки редактирования или
-    удаления другим пользователем будут игнорироваться, и пользователь будет
-    перенаправляться на страницу этого поста.
+    Редактировать комментарий может только его автор, остальные пользователи
+    перенаправляются на страницу поста. После сохранения изменений
+    пользователь возвращается на страницу поста ('Comment.get_absolute_url').
 
-    Параметры:
-        request (HttpRequest): Объект запроса, содержащий данные о текущем
-            запросе HTTP.
-        post_id (int): Первичный ключ поста, к которому относится комментарий.
-        comment_id (int): Первичный ключ комментария, который нужно
-            отредактировать или удалить.
+    Атрибуты класса:
+    - form_class: Форма, используемая для редактирования комментария.
+    """
 
-    Логика:
-        - Пытается найти пост по 'post_id' и комментарий по 'comment_id',
-            связанными друг с другом. Если не найдено, возвращается 404.
-        - Проверяет, является ли текущий пользователь (request.user) автором
-            комментария: Если нет, происходит редирект на страницу поста.
-        - Если запрос связан с удалением ('/delete_comment/' в пути):
-            - В случае метода POST' комментарий удаляется, и пользователь
-                перенаправляется на страницу поста.
-            - В случае метода 'GET' возвращается страница подтверждения
-                удаления.
-        - Если запрос связан с редактированием:
-                - Если форма валидна, изменения сохраняются, и пользователь
-                    перенаправляется обратно на страницу поста.
-            - При методе 'GET' отображается форма с текущим содержимым
-                комментария.
+    form_class = CommentForm
 
-    Шаблон:
-        Использует шаблон 'blog/comment.html', где отображается либо форма
-        редактирования комментария, либо информация для подтверждения удаления.
 
-    Возвращает:
-        HttpResponse: Содержит страницу с формой редактирования/удаления
-        комментария или редирект на детальную страницу поста.
+class CommentDeleteView(
+    LoginRequiredMixin, AuthorRequiredMixin, CommentMixin, DeleteView
+):
     """
-    post = get_object_or_404(Post, pk=post_id)
-    comment = get_object_or_404(Comment, pk=comment_id, comment_post=post)
-    if comment.author != request.user:
-        return redirect('blog:post_detail', post_id=post.pk)
-    if '/delete_comment/' in request.path:
-        if request.method == 'POST':
-            comment.delete()
-            return redirect('blog:post_detail', post_id=post.pk)
-        return render(request, 'blog/comment.html', {
-            'comment': comment,
-        })
-    form = CommentForm(request.POST or None, instance=comment)
-    if form.is_valid():
-        form.save()
-        return redirect('blog:post_detail', post_id=post.pk)
-    return render(request, 'blog/comment.html', {
-        'form': form,
-        'comment': comment,
-    })
+    Представление для удаления комментария.
 
+    Удалить комментарий может только его автор, остальные пользователи
+    перенаправляются на страницу поста. На GET-запрос отображается страница
+    подтверждения, на POST-запрос комментарий удаляется и выполняется
+    перенаправление на страницу поста.
 
+    Атрибуты класса:
+    - extra_context: Признак 'is_delete', по которому общий с
+        редактированием шаблон выводит страницу подтверждения удаления.
+    """
+
+    extra_context = {'is_delete': True}
+
+    def get_success_url(self):
+        return self.object.get_absolute_url()
+
+
+@condition(etag_func=page_etag)
+@cache_page_for_anonymous(PAGE_CACHE_TIMEOUT)
 def category_posts(request, category_slug):
     """
     Отображения списка постов, связанных с заданной категорией.
 
     Эта функция извлекает категорию на основе предоставленного 'category_slug'
     и проверяет, опубликована ли она. Затем она фильтрует посты, связанные с
-    данной категорией, с учетом опубликованных постов, аннотируя их количеством
-    комментариев и сортируя по дате публикации в порядке убывания.
+    данной категорией, с учетом опубликованных постов, и сортирует их по дате
+    публикации в порядке убывания.
     Отфильтрованные данные представляются через пагинацию.
 
     Аргументы:
@@ -452,8 +485,8 @@ def category_posts(request, category_slug):
 
     Логика выполнения:
         1. Получение объекта категории:
-            - Используется функция 'get_object_or_404' для получения категории
-                из модели 'Category' на основе слага.
+            - Используется функция 'get_published_category', которая берёт
+                категорию из кэша или из модели 'Category' на основе слага.
             - Проверяется, что категория опубликована ('is_published=True').
                 Если категория не найдена или не опубликована, возвращается
                 ошибка 404.
@@ -466,11 +499,12 @@ def category_posts(request, category_slug):
         3. Пагинация:
             - Посты разбиваются на страницы с фиксированным количеством постов
                 (указано в переменной 'POSTS_LIMIT').
-            - Объект 'page_obj' формируется через 'Paginator.get_page()'.
+            - Объект 'page_obj' формируется через 'Paginator.get_page()',
+                а при параметре 'after' — по курсору ('paginate_keyset').
 
         4. Контекст:
-            - Создается словарь 'context', содержащий текущую категорию и
-                объект пагинации 'page_obj'.
+            - Создается словарь 'context', содержащий текущую категорию,
+                объект пагинации 'page_obj' и версию кэша 'cache_version'.
 
         5. Рендеринг:
             - Шаблон 'blog/category.html' заполняется контекстом и
@@ -483,24 +517,38 @@ def category_posts(request, category_slug):
     Возвращает:
         HttpResponse: Сформированный HTTP-ответ с отрендеренным шаблоном.
 
+    Кэширование:
+        Для анонимных посетителей готовый HTML кэшируется на
+        PAGE_CACHE_TIMEOUT секунд декоратором 'cache_page_for_anonymous'.
+        Ответ содержит ETag ('page_etag'), и при повторном запросе
+        неизменившейся страницы возвращается ответ 304.
+        Список публикаций в шаблоне кэшируется тегом '{% cache %}' для
+        каждого пользователя и номера страницы или курсора отдельно; в ключ
+        входит 'cache_version', поэтому изменения данных блога сразу видны
+        на странице. Публикации страницы загружаются и при попадании в кэш
+        фрагмента (их использует пагинация), экономится рендеринг карточек.
+
     Исключения:
         - Возвращает 404, если категория с указанным слагом не найдена или не
             опубликована.
     """
-    category = get_object_or_404(
-        Category,
-        slug=category_slug,
-        is_published=True
+    category = get_published_category(category_slug)
+    posts = get_filtered_posts(
+        extra_filters={'category': category},
+        for_list=True,
+        liked_by=request.user,
     )
-    posts = get_filtered_posts(posts=category.posts.all())
-    page_obj = paginate(posts, request, POSTS_LIMIT)
+    page_obj = paginate(posts, request, POSTS_LIMIT, keyset=True)
     context = {
         'category': category,
         'page_obj': page_obj,
+        'cache_version': get_cache_version(),
     }
     return render(request, 'blog/category.html', context)
 
 
+@condition(etag_func=page_etag)
+@cache_page_for_anonymous(PAGE_CACHE_TIMEOUT)
 def index(request):
     """
     Отображение главной страницы.
@@ -508,22 +556,23 @@ def index(request):
     Эта функция извлекает все опубликованные посты из базы данных с помощью
     'get_filtered_posts()' и выполняет следующие шаги:
     1. Сортирует посты по дате публикации в порядке убывания ('pub_date').
-    2. Добавляет к каждому посту аннотацию 'comment_count', содержащую
-        количество комментариев через 'Count('comments')'.
+    2. Для каждого поста выводит количество комментариев из поля
+        'comment_count', которое обновляется при добавлении и удалении
+        комментариев.
     3. Реализует постраничную навигацию (пагинацию) с помощью 'Paginator', где
         количество постов на странице определяется глобальной переменной
         'POSTS_LIMIT'.
-    4. Извлекает номер текущей страницы из параметров GET-запроса ('page'),
-        передает объект текущей страницы в контекст шаблона и рендерит
-        HTML-страницу.
+    4. Извлекает номер текущей страницы из параметров GET-запроса ('page')
+        или курсор ('after', см. 'paginate_keyset'), передает объект текущей
+        страницы в контекст шаблона и рендерит HTML-страницу.
 
     Аргументы:
         request (HttpRequest): Объект HTTP-запроса, содержащий информацию о
             запросе, включая параметры GET.
 
     Переменные:
-        posts (QuerySet): Список опубликованных постов с добавленным
-            количеством комментариев.
+        posts (QuerySet): Список опубликованных постов с количеством
+            комментариев.
         page_obj (Page): Объект текущей страницы, содержащий посты для
             отображения.
 
@@ -535,12 +584,27 @@ def index(request):
         page_obj (Page): Объект текущей страницы, который передается в шаблон.
             Содержит посты для отображения на этой странице и дополнительную
             информацию о пагинации.
+        cache_version (int): Версия кэша блога для ключа кэша списка постов.
+
+    Кэширование:
+        Для анонимных посетителей готовый HTML кэшируется на
+        PAGE_CACHE_TIMEOUT секунд декоратором 'cache_page_for_anonymous'.
+        Ответ содержит ETag ('page_etag'), и при повторном запросе
+        неизменившейся страницы возвращается ответ 304.
+        Список публикаций в шаблоне кэшируется тегом '{% cache %}' для
+        каждого пользователя и номера страницы или курсора отдельно; в ключ
+        входит 'cache_version', поэтому изменения данных блога сразу видны
+        на странице. Публикации страницы загружаются и при попадании в кэш
+        фрагмента (их использует пагинация), экономится рендеринг карточек.
 
     Возвращает:
         HttpResponse: Рендерит и возвращает главную страницу блога с постами и
             пагинацией.
     """
-    posts = get_filtered_posts()
-    page_obj = paginate(posts, request, POSTS_LIMIT)
-    context = {'page_obj': page_obj}
+    posts = get_filtered_posts(for_list=True, liked_by=request.user)
+    page_obj = paginate(posts, request, POSTS_LIMIT, keyset=True)
+    context = {
+        'page_obj': page_obj,
+        'cache_version': get_cache_version(),
+    }
     return render(request, 'blog/index.html', context)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -112,3 +113,25 @@ STATIC_URL = '/static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Версия кэша блога, готовые страницы и счётчики пагинатора хранятся в
+# кэше Django. Если сервер запущен в нескольких процессах, кэш должен быть
+# общим для них: укажите адрес memcached в переменной окружения
+# MEMCACHED_LOCATION (например, 127.0.0.1:11211). Без неё используется
+# локальный кэш процесса, который подходит только для разработки и
+# запуска в одном процессе.
+if os.getenv('MEMCACHED_LOCATION'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+            'LOCATION': os.getenv('MEMCACHED_LOCATION'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+CACHED_PAGINATOR_TIMEOUT = 60
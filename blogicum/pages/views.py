@@ -1,4 +1,26 @@
+from functools import lru_cache
+
+from django.http import HttpResponse
 from django.shortcuts import render
+from django.template.loader import render_to_string
+
+
+@lru_cache(maxsize=None)
+def render_static_page(template_name):
+    """
+    Отрисовывает шаблон страницы ошибки один раз за время работы процесса.
+
+    Шаблон отрисовывается без запроса, то есть так, как его видит анонимный
+    посетитель, и при следующих вызовах возвращается готовый HTML. Новая
+    версия шаблона подхватывается после перезапуска процесса.
+
+    Args:
+        template_name (str): Имя шаблона страницы.
+
+    Returns:
+        str: Готовый HTML страницы.
+    """
+    return render_to_string(template_name)
 
 
 def page_not_found(request, exception):
@@ -25,7 +47,9 @@ def csrf_failure(request, reason=''):
 
     Эта функция вызывается, если CSRF-токен отсутствует, поврежден или не
     совпадает с ожидаемым значением. В ответ возвращается кастомизированная
-    страница с кодом состояния 403 и сообщением об ошибке.
+    страница с кодом состояния 403 и сообщением об ошибке. Анонимным
+    посетителям отдаётся заранее отрисованная страница
+    ('render_static_page'), остальным — страница с их меню.
 
     Args:
         request: Объект HTTP-запроса.
@@ -34,6 +58,9 @@ def csrf_failure(request, reason=''):
     Returns:
         HttpResponse: Сгенерированный HTML с кодом состояния 403.
     """
+    if not request.user.is_authenticated:
+        return HttpResponse(
+            render_static_page('pages/403csrf.html'), status=403)
     return render(request, 'pages/403csrf.html', status=403)
 
 
@@ -44,6 +71,9 @@ def server_error(request):
     Эта функция вызывается автоматически, если на сервере происходит
     внутренняя ошибка, в результате которой сервер не может обработать запрос.
     Она возвращает кастомизированную HTML-страницу для ошибки 500.
+    Страница отрисовывается без запроса и один раз ('render_static_page'):
+    при внутренней ошибке обработчик не обращается к сессии и базе данных,
+    которые могут быть её причиной.
 
     Args:
         request: Объект HTTP-запроса.
@@ -51,4 +81,4 @@ def server_error(request):
     Returns:
         HttpResponse: Сгенерированный HTML с кодом состояния 500.
     """
-    return render(request, 'pages/500.html', status=500)
+    return HttpResponse(render_static_page('pages/500.html'), status=500)